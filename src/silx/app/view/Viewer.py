@@ -404,26 +404,10 @@ class Viewer(qt.QMainWindow):
         qt.QApplication.setOverrideCursor(qt.Qt.WaitCursor)
 
         selection = self.__treeview.selectionModel()
-        indexes = selection.selectedIndexes()
-        model = self.__treeview.model()
-        while len(indexes) > 0:
-            index = indexes.pop(0)
-            if isinstance(index, tuple):
-                index, depth = index
-            else:
-                depth = 0
+        for index in selection.selectedIndexes():
             if index.column() != 0:
                 continue
-
-            if depth > 10:
-                # Avoid infinite loop with recursive links
-                break
-
-            if model.hasChildren(index):
-                self.__treeview.setExpanded(index, True)
-                for row in range(model.rowCount(index)):
-                    childIndex = model.index(row, 0, index)
-                    indexes.append((childIndex, depth + 1))
+            self.__treeview.expandFromIndex(index, 10)
         qt.QApplication.restoreOverrideCursor()
 
     def __collapseAllSelected(self):
@@ -340,6 +340,12 @@ class _ColormapHistogram(qt.QWidget):
         self._finiteRange = None, None
         self._initPlot()
 
+        self.__lutUpdateTimer = qt.QTimer(self)
+        """Throttle updates of the LUT item while dragging a marker"""
+        self.__lutUpdateTimer.setSingleShot(True)
+        self.__lutUpdateTimer.setInterval(16)  # ~60 updates per second
+        self.__lutUpdateTimer.timeout.connect(self.__updateDraggedLutItem)
+
         self._histogramData = {}
         """Histogram displayed in the plot"""
 
@@ -351,7 +357,15 @@ class _ColormapHistogram(qt.QWidget):
 
         self._invalidated = False
 
+    def showEvent(self, event):
+        if self._plot is None:
+            self._createPlot()
+            self._invalidated = True
+        super(_ColormapHistogram, self).showEvent(event)
+
     def paintEvent(self, event):
+        if self._plot is None:
+            return super(_ColormapHistogram, self).paintEvent(event)
         if self._invalidated:
             self._updateDisplayMode()
             self._invalidated = False
@@ -510,36 +524,15 @@ class _ColormapHistogram(qt.QWidget):
         return posMin, posMax
 
     def _initPlot(self):
-        """Init the plot to display the range and the values"""
-        self._plot = PlotWidget(self)
-        self._plot.setAxesDisplayed(False)
-        self._plot.setDataMargins(0.125, 0.125, 0.01, 0.01)
-        self._plot.getXAxis().setLabel("Data Values")
-        self._plot.getYAxis().setLabel("")
-        self._plot.setInteractiveMode("select", zoomOnWheel=False)
-        self._plot.setActiveCurveHandling(False)
-        self._plot.setMinimumSize(qt.QSize(250, 200))
-        self._plot.sigPlotSignal.connect(self._plotEventReceived)
-        palette = self.palette()
-        color = palette.color(qt.QPalette.Active, qt.QPalette.Window)
-        self._plot.setBackgroundColor(color)
-        self._plot.setDataBackgroundColor("white")
-
-        lut = numpy.arange(256)
-        lut.shape = 1, -1
-        self._plot.addImage(lut, legend="lut")
-        self._lutItem = self._plot._getItem("image", "lut")
-        self._lutItem.setVisible(False)
+        """Init the toolbar of the plot.
 
-        self._plot.addScatter(x=[], y=[], value=[], legend="lut2")
-        self._lutItem2 = self._plot._getItem("scatter", "lut2")
-        self._lutItem2.setVisible(False)
-        self.__lutY = numpy.array([-0.05] * 256)
-        self.__lutV = numpy.arange(256)
-
-        self._bound = BoundingRect()
-        self._plot.addItem(self._bound)
-        self._bound.setVisible(True)
+        The plot itself is only created when the widget is shown
+        (see :meth:`_createPlot`).
+        """
+        self._plot = None
+        self._lutItem = None
+        self._lutItem2 = None
+        self._bound = None
 
         # Add plot for histogram
         self._plotToolbar = qt.QToolBar(self)
@@ -582,10 +575,47 @@ class _ColormapHistogram(qt.QWidget):
         plotBoxLayout.setContentsMargins(0, 0, 0, 0)
         plotBoxLayout.setSpacing(2)
         plotBoxLayout.addWidget(self._plotToolbar)
-        plotBoxLayout.addWidget(self._plot)
         plotBoxLayout.setSizeConstraint(qt.QLayout.SetMinimumSize)
         self.setLayout(plotBoxLayout)
 
+    def _createPlot(self):
+        """Create the plot to display the range and the values.
+
+        This is done on demand as many dialogs are never displayed.
+        """
+        self._plot = PlotWidget(self)
+        self._plot.setAxesDisplayed(False)
+        self._plot.setDataMargins(0.125, 0.125, 0.01, 0.01)
+        self._plot.getXAxis().setLabel("Data Values")
+        self._plot.getYAxis().setLabel("")
+        self._plot.setInteractiveMode("select", zoomOnWheel=False)
+        self._plot.setActiveCurveHandling(False)
+        self._plot.setMinimumSize(qt.QSize(250, 200))
+        self._plot.sigPlotSignal.connect(self._plotEventReceived)
+        palette = self.palette()
+        color = palette.color(qt.QPalette.Active, qt.QPalette.Window)
+        self._plot.setBackgroundColor(color)
+        self._plot.setDataBackgroundColor("white")
+
+        lut = numpy.arange(256)
+        lut.shape = 1, -1
+        self._plot.addImage(lut, legend="lut")
+        self._lutItem = self._plot._getItem("image", "lut")
+        self._lutItem.setVisible(False)
+
+        self._plot.addScatter(x=[], y=[], value=[], legend="lut2")
+        self._lutItem2 = self._plot._getItem("scatter", "lut2")
+        self._lutItem2.setVisible(False)
+        self.__lutY = numpy.array([-0.05] * 256)
+        self.__lutV = numpy.arange(256)
+        self.__lutScatterKey = None
+
+        self._bound = BoundingRect()
+        self._plot.addItem(self._bound)
+        self._bound.setVisible(True)
+
+        self.layout().addWidget(self._plot)
+
     def _plotEventReceived(self, event):
         """Handle events from the plot"""
         kind = event["event"]
@@ -608,14 +638,21 @@ class _ColormapHistogram(qt.QWidget):
                 self._dragging = False, False, True
                 self._last = None, None, value
                 self.sigRangeMoving.emit(*self._last)
-            self._updateLutItem(self._finiteRange)
+            if not self.__lutUpdateTimer.isActive():
+                self.__lutUpdateTimer.start()
         elif kind == "markerMoved":
+            if self.__lutUpdateTimer.isActive():
+                self.__lutUpdateTimer.stop()
+                self.__updateDraggedLutItem()
             self.sigRangeMoved.emit(*self._last)
             self._plot.resetZoom()
             self._dragging = False, False, False
         else:
             pass
 
+    def __updateDraggedLutItem(self):
+        self._updateLutItem(self._finiteRange)
+
     def _updateMarkerPosition(self):
         colormap = self.getColormap()
         posMin, posMax = self._getDisplayableRange()
@@ -627,7 +664,7 @@ class _ColormapHistogram(qt.QWidget):
 
         with utils.blockSignals(self):
             if posMin is not None and not self._dragging[0]:
-                self._plot.addXMarker(
+                self._setXMarker(
                     posMin,
                     legend="Min",
                     text="Min",
@@ -637,7 +674,7 @@ class _ColormapHistogram(qt.QWidget):
                 )
             self._updateGammaPosition()
             if posMax is not None and not self._dragging[1]:
-                self._plot.addXMarker(
+                self._setXMarker(
                     posMax,
                     legend="Max",
                     text="\n\nMax",
@@ -649,6 +686,23 @@ class _ColormapHistogram(qt.QWidget):
         self._updateLutItem((posMin, posMax))
         self._plot.resetZoom()
 
+    def _setXMarker(self, x, legend, draggable, **kwargs):
+        """Move a vertical marker of the plot, creating it only if needed.
+
+        This is called at each repaint, so an existing marker is moved
+        in-place instead of being fully reconfigured with `addXMarker`.
+
+        :returns: The marker item
+        """
+        marker = self._plot._getMarker(legend)
+        if marker is None or marker.isDraggable() != draggable:
+            legend = self._plot.addXMarker(
+                x, legend=legend, draggable=draggable, **kwargs
+            )
+            return self._plot._getMarker(legend)
+        marker.setPosition(x, 0)
+        return marker
+
     def _updateGammaPosition(self):
         colormap = self.getColormap()
         posMin, posMax = self._getDisplayableRange()
@@ -668,15 +722,13 @@ class _ColormapHistogram(qt.QWidget):
                     gammaPos = posMin + posRange * 0.5 ** (1 / gamma)
                 else:
                     gammaPos = posMin
-                marker = self._plot._getMarker(
-                    self._plot.addXMarker(
-                        gammaPos,
-                        legend="Gamma",
-                        text="\nGamma",
-                        draggable=True,
-                        color="blue",
-                        constraint=self._plotGammaMarkerConstraint,
-                    )
+                marker = self._setXMarker(
+                    gammaPos,
+                    legend="Gamma",
+                    text="\nGamma",
+                    draggable=True,
+                    color="blue",
+                    constraint=self._plotGammaMarkerConstraint,
                 )
                 marker.setZValue(2)
         else:
@@ -685,6 +737,23 @@ class _ColormapHistogram(qt.QWidget):
             except Exception:
                 pass
 
+    def _updateLutScatter(self, colormap, space, posMin, posMax):
+        """Display the LUT with the scatter item.
+
+        The scatter positions are only recomputed when the range changes,
+        as this is called on each repaint of the widget.
+        """
+        if self._lutItem2.getColormap() != colormap:
+            self._lutItem2.setColormap(colormap)
+        key = space, posMin, posMax
+        if key != self.__lutScatterKey:
+            self.__lutScatterKey = key
+            self._lutItem2.setVisible(False)
+            xx = space(posMin, posMax, 256)
+            self._lutItem2.setData(x=xx, y=self.__lutY, value=self.__lutV, copy=False)
+            self._lutItem2.setSymbol("|")
+        self._lutItem2.setVisible(True)
+
     def _updateLutItem(self, vRange):
         colormap = self.getColormap()
         if colormap is None:
@@ -715,26 +784,12 @@ class _ColormapHistogram(qt.QWidget):
                 self._lutItem.setVisible(True)
                 self._lutItem2.setVisible(False)
             elif norm == Colormap.LOGARITHM:
-                self._lutItem2.setVisible(False)
-                self._lutItem2.setColormap(normColormap)
-                xx = numpy.geomspace(posMin, posMax, 256)
-                self._lutItem2.setData(
-                    x=xx, y=self.__lutY, value=self.__lutV, copy=False
-                )
-                self._lutItem2.setSymbol("|")
-                self._lutItem2.setVisible(True)
+                self._updateLutScatter(normColormap, numpy.geomspace, posMin, posMax)
                 self._lutItem.setVisible(False)
             else:
                 # Fallback: Display with linear axis and applied normalization
-                self._lutItem2.setVisible(False)
                 normColormap.setNormalization(norm)
-                self._lutItem2.setColormap(normColormap)
-                xx = numpy.linspace(posMin, posMax, 256, endpoint=True)
-                self._lutItem2.setData(
-                    x=xx, y=self.__lutY, value=self.__lutV, copy=False
-                )
-                self._lutItem2.setSymbol("|")
-                self._lutItem2.setVisible(True)
+                self._updateLutScatter(normColormap, numpy.linspace, posMin, posMax)
                 self._lutItem.setVisible(False)
 
             self._bound.setBounds((posMin, posMax, -0.1, 1))
@@ -777,7 +832,8 @@ class _ColormapHistogram(qt.QWidget):
         if self._displayMode == mode:
             return
         self._displayMode = mode
-        self._updateDisplayMode()
+        if self._plot is not None:
+            self._updateDisplayMode()
 
     def getDisplayMode(self) -> DisplayMode:
         return self._displayMode
@@ -826,6 +882,7 @@ class _ColormapHistogram(qt.QWidget):
                     align="center",
                     fill=True,
                     z=1,
+                    copy=False,
                 )
 
         elif mode == DisplayMode.HISTOGRAM:
@@ -833,10 +890,10 @@ class _ColormapHistogram(qt.QWidget):
             if histogram is None or bin_edges is None:
                 self._plot.remove(legend="Data", kind="histogram")
             else:
-                histogram = numpy.array(histogram, copy=True)
-                bin_edges = numpy.array(bin_edges, copy=True)
                 with numpy.errstate(invalid="ignore"):
                     norm_histogram = histogram / numpy.nanmax(histogram)
+                # norm_histogram is a new array and the cached bin_edges are
+                # never modified: no need to copy them
                 self._plot.addHistogram(
                     norm_histogram,
                     bin_edges,
@@ -845,6 +902,7 @@ class _ColormapHistogram(qt.QWidget):
                     align="center",
                     fill=True,
                     z=1,
+                    copy=False,
                 )
         else:
             _logger.error("Mode unsupported")
@@ -853,7 +911,8 @@ class _ColormapHistogram(qt.QWidget):
         return self.layout().minimumSize()
 
     def updateLut(self):
-        self._updateLutItem(None)
+        if self._plot is not None:
+            self._updateLutItem(None)
 
     def _getNorm(self):
         colormap = self.getColormap()
@@ -864,7 +923,9 @@ class _ColormapHistogram(qt.QWidget):
             return norm
 
     def updateNormalization(self):
-        self._updateDisplayMode()
+        # Deferred to the next paint event, so that successive colormap
+        # updates only rebuild the displayed histogram once
+        self._invalidated = True
         self.update()
 
 
@@ -1416,7 +1477,11 @@ class ColormapDialog(qt.QDialog):
         if hist is None or bin_edges is None:
             self._histogramData = None
         else:
-            self._histogramData = numpy.array(hist), numpy.array(bin_edges)
+            hist, bin_edges = numpy.array(hist), numpy.array(bin_edges)
+            # Read-only as they are displayed without copy
+            hist.flags.writeable = False
+            bin_edges.flags.writeable = False
+            self._histogramData = hist, bin_edges
 
         self._invalidateData()
 
@@ -1458,7 +1523,10 @@ class ColormapDialog(qt.QDialog):
         :param float positiveMin: The positive minimum of the data
         :param float maximum: The maximum of the data
         """
-        self._dataRange = minimum, positiveMin, maximum
+        dataRange = minimum, positiveMin, maximum
+        if dataRange == self._dataRange:
+            return
+        self._dataRange = dataRange
         self._invalidateData()
 
     def _setColormapRange(self, xmin, xmax):
@@ -1688,11 +1756,7 @@ class ColormapDialog(qt.QDialog):
             colormap = self.getColormap()
             colormap.setVRange(vmin, vmax)
 
-        with utils.blockSignals(self._minValue):
-            self._minValue.setValue(vmin or dataRange[0], isAuto=vmin is None)
-        with utils.blockSignals(self._maxValue):
-            self._maxValue.setValue(vmax or dataRange[1], isAuto=vmax is None)
-
+        # Also updates the min/max widgets with signals blocked
         self._updateWidgetRange()
 
     def _normalizationUpdated(self, index):
@@ -304,6 +304,40 @@ def testColormapEditableMode(qWidgetFactory):
     assert not (resetButton.isEnabled())
 
 
+def testAutoRangeButtons(qWidgetFactory):
+    colormap = Colormap(name="gray", vmin=10.0, vmax=20.0, normalization="linear")
+    dialog = qWidgetFactory(ColormapDialog.ColormapDialog)
+    dialog.setColormap(colormap)
+    dialog.setData(numpy.arange(100))
+
+    dialog._autoButtons.autoRangeChanged.emit((True, False))
+    assert colormap.getVRange() == (None, 20)
+    assert dialog._minValue.isAutoChecked()
+    assert not dialog._maxValue.isAutoChecked()
+    assert dialog._maxValue.getValue() == 20
+
+
+def testSetDataRangeUnchanged(qWidgetFactory):
+    dialog = qWidgetFactory(ColormapDialog.ColormapDialog)
+    dialog.setDataRange(1, 1, 10)
+    assert dialog._getDataRange() == (1, 1, 10)
+
+    histogram = dialog._histoWidget
+    invalidateData = histogram.invalidateData
+    calls = []
+
+    def countInvalidateData():
+        calls.append(None)
+        invalidateData()
+
+    histogram.invalidateData = countInvalidateData
+    dialog.setDataRange(1, 1, 10)
+    assert calls == []
+    dialog.setDataRange(1, 1, 20)
+    assert len(calls) == 1
+    assert dialog._getDataRange() == (1, 1, 20)
+
+
 def testImageData(qWidgetFactory):
     dialog = qWidgetFactory(ColormapDialog.ColormapDialog)
     data = numpy.random.rand(5, 5)
@@ -395,3 +429,17 @@ def testUpdateImageData(qapp, qWidgetFactory):
     item.setData([(1, 2), (3, 4)])
 
     assert dialog._histoWidget.getFiniteRange() == (1, 4)
+
+
+def testLazyHistogramPlot(qapp, qWidgetFactory):
+    """Check that the histogram plot is only created when displayed"""
+    dialog = qWidgetFactory(ColormapDialog.ColormapDialog)
+    dialog.setData(numpy.arange(10))
+    # Without colormap, the histogram is hidden
+    assert dialog._histoWidget._plot is None
+
+    # The dialog only holds a weak reference to the colormap
+    colormap = Colormap()
+    dialog.setColormap(colormap)
+    qapp.processEvents()
+    assert dialog._histoWidget._plot is not None
@@ -27,9 +27,10 @@ __license__ = "MIT"
 __date__ = "30/04/2018"
 
 
+import inspect
 import logging
+import weakref
 from .. import qt
-from ...utils import weakref as silxweakref
 from .Hdf5TreeModel import Hdf5TreeModel
 from .Hdf5HeaderView import Hdf5HeaderView
 from .NexusSortFilterProxyModel import NexusSortFilterProxyModel
@@ -39,6 +40,46 @@ from . import _utils
 _logger = logging.getLogger(__name__)
 
 
+class _ContextMenuRunnable(qt.QRunnable):
+    """Runner calling an asynchronous context menu callback"""
+
+    class __Signals(qt.QObject):
+        """Signal holder"""
+
+        runnerFinished = qt.Signal(object, object)
+
+    def __init__(self, callback, event, placeholder):
+        """Constructor
+
+        :param callable callback: The asynchronous callback
+        :param Hdf5ContextMenuEvent event: The context menu event
+        :param qt.QAction placeholder: Action displayed while callbacks
+            of this menu are running
+        """
+        super(_ContextMenuRunnable, self).__init__()
+        self.callback = callback
+        self.event = event
+        self.placeholder = placeholder
+        self.signals = self.__Signals()
+
+    @property
+    def runnerFinished(self):
+        return self.signals.runnerFinished
+
+    def run(self):
+        """Call the callback and send its result with a signal"""
+        try:
+            result = self.callback(self.event)
+        except Exception:
+            # make sure no user callback crash the application
+            _logger.error("Error while calling callback", exc_info=True)
+            result = None
+        self.runnerFinished.emit(self, result)
+
+    def autoDelete(self):
+        return True
+
+
 class Hdf5TreeView(qt.QTreeView):
     """TreeView which allow to browse HDF5 file structure.
 
@@ -55,7 +96,8 @@ class Hdf5TreeView(qt.QTreeView):
     Qt.CustomContextMenu. This policy must not be changed, otherwise context
     menus will not work anymore. You can use :meth:`addContextMenuCallback` and
     :meth:`removeContextMenuCallback` to add your custum actions according
-    to the selected objects.
+    to the selected objects. Callbacks which have to read data can be
+    registered with :meth:`addAsyncContextMenuCallback`.
     """
 
     def __init__(self, parent=None):
@@ -81,7 +123,13 @@ class Hdf5TreeView(qt.QTreeView):
         self.setDragDropMode(qt.QAbstractItemView.DragDrop)
         self.showDropIndicator()
 
-        self.__context_menu_callbacks = silxweakref.WeakList()
+        self.__context_menu_callbacks = {}
+        """Weak references to the context menu callbacks, keyed by identity,
+        in insertion order"""
+        self.__async_context_menu_callbacks = {}
+        """Weak references to the asynchronous context menu callbacks, keyed
+        by identity"""
+        self.__context_menu_runners = set()
         self.setContextMenuPolicy(qt.Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._createContextMenu)
 
@@ -94,9 +142,41 @@ class Hdf5TreeView(qt.QTreeView):
         proxy_model.setSourceModel(model)
         return proxy_model
 
-    def __removeContextMenuProxies(self, ref):
-        """Callback to remove dead proxy from the list"""
-        self.__context_menu_callbacks.remove(ref)
+    @staticmethod
+    def __addCallback(callbacks, callback):
+        """Store a weak reference to a callback.
+
+        Callbacks are keyed by identity, as weak references to a method and
+        to its owner share the same hash, and the owner can be unhashable.
+
+        :param dict callbacks: Weak references to callbacks
+        :param callable callback: The callback to store
+        """
+        if inspect.ismethod(callback):
+            key = id(callback.__self__), callback.__func__
+            ref = weakref.WeakMethod(callback)
+        else:
+            key = id(callback)
+            ref = weakref.ref(callback)
+        callbacks[key] = ref
+
+    @staticmethod
+    def __removeCallback(callbacks, callback):
+        """Remove the weak reference to a callback.
+
+        :param dict callbacks: Weak references to callbacks
+        :param callable callback: The callback to remove
+        :raises ValueError: If the callback is not registered
+        """
+        if inspect.ismethod(callback):
+            key = id(callback.__self__), callback.__func__
+        else:
+            key = id(callback)
+        ref = callbacks.get(key, None)
+        if ref is None or ref() is None:
+            # A dead reference is from another object which had the same id
+            raise ValueError("Callback %s is not registered" % callback)
+        del callbacks[key]
 
     def _createContextMenu(self, pos):
         """
@@ -116,7 +196,7 @@ class Hdf5TreeView(qt.QTreeView):
         hovered_object = _utils.H5Node(hovered_node)
         event = _utils.Hdf5ContextMenuEvent(self, menu, hovered_object)
 
-        for callback in self.__context_menu_callbacks:
+        for callback in self.__liveCallbacks(self.__context_menu_callbacks):
             try:
                 callback(event)
             except KeyboardInterrupt:
@@ -126,11 +206,59 @@ class Hdf5TreeView(qt.QTreeView):
                 _logger.error("Error while calling callback", exc_info=True)
                 pass
 
+        asyncCallbacks = list(self.__liveCallbacks(self.__async_context_menu_callbacks))
+        if asyncCallbacks:
+            placeholder = menu.addAction("Loading...")
+            placeholder.setEnabled(False)
+            threadPool = qt.silxGlobalThreadPool()
+            for callback in asyncCallbacks:
+                runner = _ContextMenuRunnable(callback, event, placeholder)
+                runner.runnerFinished.connect(self.__asyncContextMenuCallbackFinished)
+                self.__context_menu_runners.add(runner)
+                threadPool.start(runner)
+
         if not menu.isEmpty():
             for action in actions:
                 menu.addAction(action)
             menu.popup(self.viewport().mapToGlobal(pos))
 
+    @staticmethod
+    def __liveCallbacks(callbacks):
+        """Yield the callbacks still alive and drop the dead references.
+
+        :param dict callbacks: Weak references to callbacks
+        """
+        for key, ref in list(callbacks.items()):
+            callback = ref()
+            if callback is None:
+                del callbacks[key]
+                continue
+            yield callback
+
+    def __asyncContextMenuCallbackFinished(self, runner, populate):
+        """Add the result of an asynchronous callback to its menu"""
+        self.__context_menu_runners.discard(runner)
+        placeholder = runner.placeholder
+        menu = runner.event.menu()
+        # keep the placeholder at the end of the menu
+        menu.removeAction(placeholder)
+        if populate is not None:
+            try:
+                populate(runner.event)
+            except KeyboardInterrupt:
+                raise
+            except Exception:
+                _logger.error("Error while calling callback", exc_info=True)
+
+        for other in self.__context_menu_runners:
+            if other.placeholder is placeholder:
+                # other callbacks are still running for this menu
+                menu.addAction(placeholder)
+                break
+        else:
+            if menu.isEmpty():
+                menu.close()
+
     def addContextMenuCallback(self, callback):
         """Register a context menu callback.
 
@@ -141,30 +269,80 @@ class Hdf5TreeView(qt.QTreeView):
         Callbacks are stored as saferef. The object must store a reference by
         itself.
         """
-        self.__context_menu_callbacks.append(callback)
+        self.__addCallback(self.__context_menu_callbacks, callback)
 
     def removeContextMenuCallback(self, callback):
-        """Unregister a context menu callback"""
-        self.__context_menu_callbacks.remove(callback)
+        """Unregister a context menu callback
+
+        :raises ValueError: If the callback is not registered
+        """
+        self.__removeCallback(self.__context_menu_callbacks, callback)
+
+    def addAsyncContextMenuCallback(self, callback):
+        """Register a context menu callback called from a thread.
+
+        The callback is called with the context menu event from a thread of
+        the pool, so it can read data without blocking the menu, which is
+        displayed with a placeholder in the meantime. It must not access the
+        menu or any widget. It returns either None or a function which is
+        then called from the main thread with the same event to add actions
+        to the menu.
+
+        Callbacks are stored as saferef. The object must store a reference by
+        itself.
+        """
+        self.__addCallback(self.__async_context_menu_callbacks, callback)
+
+    def removeAsyncContextMenuCallback(self, callback):
+        """Unregister an asynchronous context menu callback
+
+        :raises ValueError: If the callback is not registered
+        """
+        self.__removeCallback(self.__async_context_menu_callbacks, callback)
+
+    def setModel(self, model):
+        """Override to invalidate the cached :class:`Hdf5TreeModel`"""
+        self.__hdf5Model = None
+        self.__isHdf5ModelCached = False
+        self.__selectedItemsCache = {}
+        qt.QTreeView.setModel(self, model)
+
+    def setSelectionModel(self, selectionModel):
+        """Override to invalidate the cached selection"""
+        self.__selectedItemsCache = {}
+        qt.QTreeView.setSelectionModel(self, selectionModel)
+
+    def selectionChanged(self, selected, deselected):
+        """Override to invalidate the cached selection"""
+        self.__selectedItemsCache = {}
+        qt.QTreeView.selectionChanged(self, selected, deselected)
+
+    def reset(self):
+        """Override to invalidate the cached selection"""
+        self.__selectedItemsCache = {}
+        qt.QTreeView.reset(self)
 
     def findHdf5TreeModel(self):
         """Find the Hdf5TreeModel from the stack of model filters.
 
+        The result is cached until the next call to :meth:`setModel`.
+        Changing the source model of the proxy models afterward is not
+        detected: call :meth:`setModel` again in this case.
+
         :returns: A Hdf5TreeModel, else None
         :rtype: Hdf5TreeModel
         """
+        if self.__isHdf5ModelCached:
+            return self.__hdf5Model
+
         model = self.model()
-        while model is not None:
-            if isinstance(model, qt.QAbstractProxyModel):
-                model = model.sourceModel()
-            else:
-                break
-        if model is None:
-            return None
-        if isinstance(model, Hdf5TreeModel):
-            return model
-        else:
-            return None
+        while isinstance(model, qt.QAbstractProxyModel):
+            model = model.sourceModel()
+        if not isinstance(model, Hdf5TreeModel):
+            model = None
+        self.__hdf5Model = model
+        self.__isHdf5ModelCached = True
+        return model
 
     def dragEnterEvent(self, event):
         model = self.findHdf5TreeModel()
@@ -198,16 +376,25 @@ class Hdf5TreeView(qt.QTreeView):
             broken links.
         :rtype: iterator(:class:`_utils.H5Node`)
         """
-        for index in self.selectedIndexes():
-            if index.column() != 0:
-                continue
-            item = self.model().data(index, Hdf5TreeModel.H5PY_ITEM_ROLE)
-            if item is None:
-                continue
-            if isinstance(item, Hdf5Item):
+        items = self.__selectedItemsCache.get(ignoreBrokenLinks)
+        if items is None:
+            # Only computed once per selection change
+            model = self.model()
+            items = []
+            for index in self.selectedIndexes():
+                if index.column() != 0:
+                    continue
+                item = model.data(index, Hdf5TreeModel.H5PY_ITEM_ROLE)
+                # Also filters out None and loading items
+                if not isinstance(item, Hdf5Item):
+                    continue
                 if ignoreBrokenLinks and item.isBrokenObj():
                     continue
-                yield _utils.H5Node(item)
+                items.append(item)
+            self.__selectedItemsCache[ignoreBrokenLinks] = items
+
+        for item in items:
+            yield _utils.H5Node(item)
 
     def __intermediateModels(self, index):
         """Returns intermediate models from the view model to the
@@ -269,6 +456,47 @@ class Hdf5TreeView(qt.QTreeView):
                 i = i.parent()
             self.setCurrentIndex(index)
 
+    def expandFromIndex(self, index, depth):
+        """Expand an item and its descendants up to the given depth.
+
+        All the items are expanded in a single traversal of the model followed
+        by a single layout of the view, which is much faster than expanding
+        the indexes one by one on big trees.
+
+        :param qt.QModelIndex index: Index of the item to expand
+        :param int depth: Number of levels of descendants to expand, 0 only
+            expands the item itself. It is mandatory, as the tree never ends
+            with recursive links.
+        :raises ValueError: If depth is negative
+        """
+        if depth < 0:
+            raise ValueError("Depth must be positive, found %d" % depth)
+        if hasattr(qt.QTreeView, "expandRecursively"):
+            # Qt >= 5.13
+            self.expandRecursively(index, depth)
+        else:
+            self._expandFromIndexByTraversal(index, depth)
+
+    def _expandFromIndexByTraversal(self, index, depth):
+        """Fallback of :meth:`expandFromIndex` for Qt < 5.13.
+
+        It expands the items one by one with updates disabled.
+        """
+        model = self.model()
+        updatesEnabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            parents = [(index, 0)]
+            while len(parents) > 0:
+                parent, level = parents.pop()
+                self.expand(parent)
+                if level < depth:
+                    for row in range(model.rowCount(parent)):
+                        child = model.index(row, 0, parent)
+                        parents.append((child, level + 1))
+        finally:
+            self.setUpdatesEnabled(updatesEnabled)
+
     def mousePressEvent(self, event):
         """Override mousePressEvent to provide a consistante compatible API
         between Qt4 and Qt5
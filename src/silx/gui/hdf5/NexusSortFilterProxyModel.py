@@ -29,6 +29,7 @@ __date__ = "29/11/2018"
 
 import logging
 import re
+import weakref
 import numpy
 from .. import qt
 from .Hdf5TreeModel import Hdf5TreeModel
@@ -46,6 +47,8 @@ class NexusSortFilterProxyModel(qt.QSortFilterProxyModel):
         qt.QSortFilterProxyModel.__init__(self, parent)
         self.__split = re.compile("(\\d+|\\D+)")
         self.__iconCache = {}
+        self.__nxClassCache = weakref.WeakKeyDictionary()
+        """NX_class attribute of the nodes, as sorting compares nodes many times"""
 
     def hasChildren(self, parent):
         """Returns true if parent has any children; otherwise returns false.
@@ -103,7 +106,7 @@ class NexusSortFilterProxyModel(qt.QSortFilterProxyModel):
         class_ = node.h5Class
         if class_ is None or class_ != silx.io.utils.H5Type.GROUP:
             return False
-        nxClass = node.obj.attrs.get("NX_class", None)
+        nxClass = self.__getNxClass(node)
         return nxClass == "NXentry"
 
     def __isNXnode(self, node):
@@ -113,9 +116,19 @@ class NexusSortFilterProxyModel(qt.QSortFilterProxyModel):
         class_ = node.h5Class
         if class_ is None or class_ != silx.io.utils.H5Type.GROUP:
             return False
-        nxClass = node.obj.attrs.get("NX_class", None)
+        nxClass = self.__getNxClass(node)
         return nxClass is not None
 
+    def __getNxClass(self, node):
+        """Returns the NX_class attribute of a group node, cached per node"""
+        try:
+            return self.__nxClassCache[node]
+        except KeyError:
+            pass
+        nxClass = node.obj.attrs.get("NX_class", None)
+        self.__nxClassCache[node] = nxClass
+        return nxClass
+
     def getWordsAndNumbers(self, name):
         """
         Returns a list of words and integers composing the name.
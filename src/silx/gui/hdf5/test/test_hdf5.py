@@ -127,6 +127,23 @@ class TestHdf5TreeModel(TestCaseQt):
             model = None
             self.qWaitForDestroy(ref)
 
+    def testMetadataCacheSize(self):
+        size = 16 * 1024 * 1024
+        try:
+            model = hdf5.Hdf5TreeModel()
+            self.assertIsNone(model.getMetadataCacheSize())
+            model.setMetadataCacheSize(size)
+            self.assertEqual(model.getMetadataCacheSize(), size)
+            model.insertFile(self.filename)
+            index = model.index(0, 0, qt.QModelIndex())
+            h5File = model.data(index, hdf5.Hdf5TreeModel.H5PY_OBJECT_ROLE)
+            config = h5File.id.get_mdc_config()
+            self.assertEqual(config.initial_size, size)
+        finally:
+            ref = weakref.ref(model)
+            model = None
+            self.qWaitForDestroy(ref)
+
     def testInsertFilenameAsync(self):
         try:
             model = hdf5.Hdf5TreeModel()
@@ -1064,6 +1081,131 @@ class TestHdf5TreeView(TestCaseQt):
         view = hdf5.Hdf5TreeView()
         view._createContextMenu(qt.QPoint(0, 0))
 
+    def testContextMenuCallbacks(self):
+        listener = SignalListener()
+        view = hdf5.Hdf5TreeView()
+        view.addContextMenuCallback(listener)
+        view.addContextMenuCallback(listener.__call__)
+        view.removeContextMenuCallback(listener)
+        view.removeContextMenuCallback(listener.__call__)
+        with self.assertRaises(ValueError):
+            view.removeContextMenuCallback(listener)
+        view._createContextMenu(qt.QPoint(0, 0))
+        self.assertEqual(listener.callCount(), 0)
+
+    def testContextMenuCallbacksOfSameObject(self):
+        class Plugin:
+            def __init__(self):
+                self.calls = []
+
+            def __eq__(self, other):
+                # Makes the object unhashable
+                return self is other
+
+            def __call__(self, event):
+                self.calls.append("call")
+
+            def extra(self, event):
+                self.calls.append("extra")
+
+        tree = commonh5.File("/foo/bar/1.mock", "w")
+        view = hdf5.Hdf5TreeView()
+        view.findHdf5TreeModel().insertH5pyObject(tree)
+        view.show()
+        self.qWaitForWindowExposed(view)
+
+        plugin = Plugin()
+        view.addContextMenuCallback(plugin)
+        view.addContextMenuCallback(plugin.extra)
+        index = view.model().index(0, 0, qt.QModelIndex())
+        view._createContextMenu(view.visualRect(index).center())
+        self.assertEqual(plugin.calls, ["call", "extra"])
+
+        view.removeContextMenuCallback(plugin)
+        view.removeContextMenuCallback(plugin.extra)
+        with self.assertRaises(ValueError):
+            view.removeContextMenuCallback(plugin.extra)
+        view.close()
+
+    def testAsyncContextMenuCallback(self):
+        tree = commonh5.File("/foo/bar/1.mock", "w")
+        view = hdf5.Hdf5TreeView()
+        view.findHdf5TreeModel().insertH5pyObject(tree)
+        view.show()
+        self.qWaitForWindowExposed(view)
+
+        menus = []
+
+        def populate(event):
+            menus.append(event.menu())
+            event.menu().addAction("Foo")
+
+        def callback(event):
+            return populate
+
+        view.addAsyncContextMenuCallback(callback)
+        index = view.model().index(0, 0, qt.QModelIndex())
+        view._createContextMenu(view.visualRect(index).center())
+        for _ in range(100):
+            if menus:
+                break
+            self.qWait(10)
+        self.assertEqual(len(menus), 1)
+        menu = menus[0]
+        # The placeholder was removed
+        self.assertEqual([a.text() for a in menu.actions()], ["Foo"])
+        menu.close()
+
+        view.removeAsyncContextMenuCallback(callback)
+        view.close()
+
+    def testFindHdf5TreeModel(self):
+        view = hdf5.Hdf5TreeView()
+        model = view.findHdf5TreeModel()
+        self.assertIsInstance(model, hdf5.Hdf5TreeModel)
+
+        proxy1 = qt.QSortFilterProxyModel(view)
+        proxy1.setSourceModel(model)
+        proxy2 = qt.QSortFilterProxyModel(view)
+        proxy2.setSourceModel(proxy1)
+        view.setModel(proxy2)
+        self.assertIs(view.findHdf5TreeModel(), model)
+
+        columns = len(hdf5.Hdf5TreeModel.COLUMN_IDS)
+        view.setModel(qt.QStandardItemModel(0, columns, view))
+        self.assertIsNone(view.findHdf5TreeModel())
+
+    def _checkExpandFromIndex(self, expandFromIndex):
+        tree = commonh5.File("/foo/bar/1.mock", "w")
+        tree.create_group("a/b/c/d")
+
+        view = hdf5.Hdf5TreeView()
+        view.findHdf5TreeModel().insertH5pyObject(tree)
+        model = view.model()
+        fileIndex = model.index(0, 0, qt.QModelIndex())
+        aIndex = model.index(0, 0, fileIndex)
+        bIndex = model.index(0, 0, aIndex)
+        cIndex = model.index(0, 0, bIndex)
+
+        expandFromIndex(view, fileIndex, 0)
+        self.assertTrue(view.isExpanded(fileIndex))
+        self.assertFalse(view.isExpanded(aIndex))
+
+        expandFromIndex(view, fileIndex, 2)
+        self.assertTrue(view.isExpanded(aIndex))
+        self.assertTrue(view.isExpanded(bIndex))
+        self.assertFalse(view.isExpanded(cIndex))
+
+        with self.assertRaises(ValueError):
+            view.expandFromIndex(fileIndex, -1)
+
+    def testExpandFromIndex(self):
+        self._checkExpandFromIndex(hdf5.Hdf5TreeView.expandFromIndex)
+
+    def testExpandFromIndexByTraversal(self):
+        """Test the fallback used when QTreeView.expandRecursively is missing"""
+        self._checkExpandFromIndex(hdf5.Hdf5TreeView._expandFromIndexByTraversal)
+
     def testSelection_OriginalModel(self):
         tree = commonh5.File("/foo/bar/1.mock", "w")
         item = tree.create_group("a/b/c/d")
@@ -1204,6 +1346,8 @@ class TestHdf5TreeView(TestCaseQt):
         view = hdf5.Hdf5TreeView()
         view.setModel(model)
         view.setSelectedH5Node(tree)
+        selection = list(view.selectedH5Nodes())
+        self.assertEqual(len(selection), 1)
         view.setSelectedH5Node(None)
 
         selection = list(view.selectedH5Nodes())
@@ -171,9 +171,7 @@ class CompareImages(qt.QMainWindow):
             self.setStatusBar(self._statusBar)
 
     def __getSealedColormap(self):
-        vrange = self._colormap.getColormapRange(
-            self.__item.getColormappedData(copy=False)
-        )
+        vrange = self._colormap.getColormapRange(self.__item)
         sealed = self._colormap.copy()
         sealed.setVRange(*vrange)
         return sealed
@@ -32,7 +32,9 @@ import numpy
 import weakref
 
 from silx.gui import qt
+from silx.gui.colors import Colormap
 from silx.gui.plot.CompareImages import CompareImages
+from silx.gui.plot.tools.compare.core import _CompareImageItem, VisualizationMode
 
 
 @pytest.fixture
@@ -234,3 +236,45 @@ def testTooltipWithoutImage(compareImages):
 def testTooltipWithSingleImage(compareImages):
     compareImages.setImage1(numpy.arange(9).reshape(3, 3))
     compareImages.getRawPixelData(1.5, 1.5)
+
+
+def testConcatenatedData(qapp):
+    item = _CompareImageItem()
+    image1 = numpy.array([[1.0, numpy.nan], [numpy.inf, 2.0]])
+    image2 = numpy.arange(4, dtype=numpy.int32).reshape(2, 2)
+    item.setImageData1(image1)
+    item.setImageData2(image2)
+
+    data = item.getColormappedData(copy=False)
+    numpy.testing.assert_array_equal(data, [1.0, 2.0, 0.0, 1.0, 2.0, 3.0])
+    assert item.getColormappedData(copy=False) is data
+    assert not data.flags.writeable
+    copied = item.getColormappedData(copy=True)
+    assert copied is not data
+    assert copied.flags.writeable
+
+    # Use finite data to compute statistics of the difference
+    image1 = numpy.array([[1.0, 4.0], [5.0, 2.0]])
+    item.setImageData1(image1)
+    item.setVizualisationMode(VisualizationMode.COMPOSITE_A_MINUS_B)
+    data = item.getColormappedData(copy=False)
+    numpy.testing.assert_array_equal(data, image1 - image2)
+
+    item.setImageData2(image2[:1])
+    assert item.getColormappedData(copy=False) is None
+
+
+def testFiniteMinMax(qapp):
+    item = _CompareImageItem()
+    assert item._getFiniteMinMax() == (None, None, None)
+
+    item.setImageData1(numpy.array([[-1.0, numpy.nan], [numpy.inf, 2.0]]))
+    item.setImageData2(numpy.arange(4, dtype=numpy.int32).reshape(2, 2) + 1)
+    assert item._getFiniteMinMax() == (-1.0, 1.0, 4.0)
+    assert item.getColormap().getColormapRange(item) == (-1.0, 4.0)
+    assert item._getColormapAutoscaleRange(Colormap(normalization="log")) == (1.0, 4.0)
+
+    # Use finite data to compute statistics of the difference
+    item.setImageData1(numpy.array([[-1.0, 0.5], [3.0, 2.0]]))
+    item.setVizualisationMode(VisualizationMode.COMPOSITE_A_MINUS_B)
+    assert item._getFiniteMinMax() == (None, None, None)
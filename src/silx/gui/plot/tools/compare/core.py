@@ -36,8 +36,10 @@ from typing import NamedTuple
 
 from silx.gui.plot.items.image import ImageBase
 from silx.gui.plot.items.core import ItemChangedType, ColormapMixIn
+from silx.gui.colors import Colormap
 
 from silx._utils import NP_OPTIONAL_COPY
+from silx.math.combo import min_max
 from silx.opencl import ocl
 
 if ocl is not None:
@@ -85,6 +87,25 @@ class AffineTransformation(NamedTuple):
     rot: float
 
 
+def _isAlwaysFinite(image):
+    """Returns True if the dtype of `image` cannot store NaN or inf values"""
+    return image.dtype.kind in "iub"
+
+
+def _compressFinite(image, mask, out):
+    """Copy the values of `image` selected by `mask` into the 1D array `out`.
+
+    Avoid the intermediate array of fancy indexing when dtypes are the same.
+    If `mask` is None, all the values are copied.
+    """
+    if mask is None:
+        out[...] = image.ravel()
+    elif image.dtype == out.dtype:
+        numpy.compress(mask.ravel(), image.ravel(), out=out)
+    else:
+        out[...] = image[mask]
+
+
 class _CompareImageItem(ImageBase, ColormapMixIn):
     """Description of a virtual item of images to compare, in order to share
     the data through the silx components.
@@ -96,6 +117,11 @@ class _CompareImageItem(ImageBase, ColormapMixIn):
         self.__image1 = None
         self.__image2 = None
         self.__vizualisationMode = VisualizationMode.ONLY_A
+        self.__finiteMask1 = None
+        self.__finiteMask2 = None
+        self.__concatenatedData = None
+        self.__isConcatenatedDataValid = False
+        self.__finiteRange = None, None, None
 
     def getImageData1(self):
         return self.__image1
@@ -107,12 +133,16 @@ class _CompareImageItem(ImageBase, ColormapMixIn):
         if self.__image1 is image1:
             return
         self.__image1 = image1
+        self.__finiteMask1 = None
+        self.__invalidateConcatenatedData()
         self._updated(ItemChangedType.DATA)
 
     def setImageData2(self, image2):
         if self.__image2 is image2:
             return
         self.__image2 = image2
+        self.__finiteMask2 = None
+        self.__invalidateConcatenatedData()
         self._updated(ItemChangedType.DATA)
 
     def getVizualisationMode(self) -> VisualizationMode:
@@ -162,6 +192,7 @@ class _CompareImageItem(ImageBase, ColormapMixIn):
             return None
         with self._updateColormapRange(self.__vizualisationMode, mode):
             self.__vizualisationMode = mode
+            self.__invalidateConcatenatedData()
         self._updated(ItemChangedType.DATA)
 
     def _getConcatenatedData(self, copy=True):
@@ -172,24 +203,110 @@ class _CompareImageItem(ImageBase, ColormapMixIn):
         if self.__image2 is None:
             return numpy.array(self.__image1, copy=copy or NP_OPTIONAL_COPY)
 
+        if not self.__isConcatenatedDataValid:
+            data = self.__computeConcatenatedData()
+            if data is not None:
+                # Shared without copy with copy=False, make sure it is not modified
+                data.flags.writeable = False
+            self.__concatenatedData = data
+            self.__isConcatenatedDataValid = True
+        if self.__concatenatedData is None:
+            return None
+        return numpy.array(self.__concatenatedData, copy=copy or NP_OPTIONAL_COPY)
+
+    def __invalidateConcatenatedData(self):
+        self.__concatenatedData = None
+        self.__isConcatenatedDataValid = False
+
+    def __computeConcatenatedData(self):
+        """Returns the data of both images used for the colormap"""
+        image1, image2 = self.__image1, self.__image2
         if self.__vizualisationMode == VisualizationMode.COMPOSITE_A_MINUS_B:
             # In this case the histogram have to be special
-            if self.__image1.shape == self.__image2.shape:
-                return self.__image1.astype(numpy.float32) - self.__image2.astype(
-                    numpy.float32
-                )
-        else:
-            d1 = self.__image1[numpy.isfinite(self.__image1)]
-            d2 = self.__image2[numpy.isfinite(self.__image2)]
-            return numpy.concatenate((d1, d2))
+            if image1.shape == image2.shape:
+                return image1.astype(numpy.float32) - image2.astype(numpy.float32)
+            return None
+
+        # Masks are kept until the corresponding image is changed
+        if self.__finiteMask1 is None and not _isAlwaysFinite(image1):
+            self.__finiteMask1 = numpy.isfinite(image1)
+        if self.__finiteMask2 is None and not _isAlwaysFinite(image2):
+            self.__finiteMask2 = numpy.isfinite(image2)
+        mask1, mask2 = self.__finiteMask1, self.__finiteMask2
+        size1 = image1.size if mask1 is None else numpy.count_nonzero(mask1)
+        size2 = image2.size if mask2 is None else numpy.count_nonzero(mask2)
+        data = numpy.empty(size1 + size2, dtype=numpy.result_type(image1, image2))
+        _compressFinite(image1, mask1, data[:size1])
+        _compressFinite(image2, mask2, data[size1:])
+        return data
+
+    def _getFiniteMinMax(self):
+        """Returns the range of the finite values of both images.
+
+        This is computed with a single pass over each image, without
+        concatenating them.
+
+        :returns: (min, minPositive, max), values are None if not available
+        """
+        if self.__vizualisationMode == VisualizationMode.COMPOSITE_A_MINUS_B:
+            if self.__image1 is not None and self.__image2 is not None:
+                # The colormapped data is not the images
+                return None, None, None
+
+        minima, minPositives, maxima = [], [], []
+        for image in (self.__image1, self.__image2):
+            if image is None or image.size == 0:
+                continue
+            if image.dtype.kind not in "iuf":
+                # Not supported by min_max
+                return None, None, None
+            result = min_max(image, min_positive=True, finite=True)
+            if result.minimum is None:
+                continue  # No finite values
+            minima.append(result.minimum)
+            maxima.append(result.maximum)
+            if result.min_positive is not None:
+                minPositives.append(result.min_positive)
+
+        if not minima:
+            return None, None, None
+        minPositive = min(minPositives) if minPositives else None
+        return min(minima), minPositive, max(maxima)
 
     def _updated(self, event=None, checkVisibility=True):
         # Synchronizes colormapped data if changed
         if event in (ItemChangedType.DATA, ItemChangedType.MASK):
-            data = self._getConcatenatedData(copy=False)
-            return self._setColormappedData(data, copy=False)
+            # The data is provided by getColormappedData, on demand
+            self.__finiteRange = self._getFiniteMinMax()
+            min_, minPositive, max_ = self.__finiteRange
+            return self._setColormappedData(
+                None, copy=False, min_=min_, minPositive=minPositive, max_=max_
+            )
         super()._updated(event=event, checkVisibility=checkVisibility)
 
+    def _getColormapAutoscaleRange(self, colormap=None):
+        """
+        Reimplementation of the `ColormapMixIn._getColormapAutoscaleRange`
+        method.
+
+        The min/max range is provided from the range of the images, without
+        concatenating them.
+        """
+        if colormap is None:
+            colormap = self.getColormap()
+        if colormap is not None and colormap.getAutoscaleMode() == Colormap.MINMAX:
+            min_, minPositive, max_ = self.__finiteRange
+            normalization = colormap.getNormalization()
+            if normalization == Colormap.LINEAR:
+                vmin = min_
+            elif normalization == Colormap.LOGARITHM:
+                vmin = minPositive
+            else:
+                vmin = None
+            if vmin is not None and max_ is not None:
+                return vmin, max_
+        return super()._getColormapAutoscaleRange(colormap)
+
     def getColormappedData(self, copy=True):
         """
         Reimplementation of the `ColormapMixIn.getColormappedData` method.
@@ -51,10 +51,14 @@ class ColormapNameComboBox(qt.QComboBox):
 
     def __initItems(self):
         for colormapName in colors_mdl.preferredColormaps():
-            index = self.count()
-            self.addItem(str.title(colormapName))
-            self.setItemIcon(index, self.getIconPreview(name=colormapName))
-            self.setItemData(index, colormapName, role=self.LUT_NAME)
+            self.__addNamedItem(colormapName)
+
+    def __addNamedItem(self, name):
+        """Append an item for the LUT `name`, icon and label set at insertion"""
+        index = self.count()
+        self.addItem(self.getIconPreview(name=name), str.title(name))
+        self.setItemData(index, name, role=self.LUT_NAME)
+        return index
 
     def getIconPreview(self, name=None, colors=None):
         """Return an icon preview from a LUT name.
@@ -156,8 +160,5 @@ class ColormapNameComboBox(qt.QComboBox):
     def _setCurrentName(self, name):
         index = self.findLutName(name)
         if index < 0:
-            index = self.count()
-            self.addItem(str.title(name))
-            self.setItemIcon(index, self.getIconPreview(name=name))
-            self.setItemData(index, name, role=self.LUT_NAME)
+            index = self.__addNamedItem(name)
         self.setCurrentIndex(index)
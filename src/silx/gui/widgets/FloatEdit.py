@@ -56,6 +56,8 @@ class FloatEdit(qt.QLineEdit):
         self.__minimumWidth = 30
         """Store the minimum width requested by the user, the real one is
         dynamic"""
+        self.__parsedText: tuple[str, float] | None = None
+        """Last successfully parsed (text, value), to avoid parsing again"""
         self.setValidator(validator)
         self.setAlignment(qt.Qt.AlignRight)
         self.textChanged.connect(self.__textChanged)
@@ -65,8 +67,12 @@ class FloatEdit(qt.QLineEdit):
     def value(self) -> float:
         """Return the QLineEdit current value as a float."""
         text = self.text()
+        if self.__parsedText is not None and self.__parsedText[0] == text:
+            return self.__parsedText[1]
         value, validated = self.validator().locale().toDouble(text)
-        if not validated:
+        if validated:
+            self.__parsedText = text, value
+        else:
             self.setValue(value)
         return value
 
@@ -27,6 +27,7 @@ __license__ = "MIT"
 
 import pytest
 from silx.gui import qt
+from silx.gui import utils
 from silx.gui.widgets.FloatEdit import FloatEdit
 
 
@@ -54,6 +55,14 @@ def test_value(floatEdit):
     assert floatEdit.value() == 1.5
 
 
+def test_value_updated(floatEdit):
+    floatEdit.setValue(1.5)
+    assert floatEdit.value() == 1.5
+    with utils.blockSignals(floatEdit):
+        floatEdit.setValue(2.5)
+    assert floatEdit.value() == 2.5
+
+
 def test_no_widgetresize(floatEditHolder, floatEdit):
     floatEditHolder.resize(50, 50)
     floatEdit.setValue(123)